@@ -1,10 +1,31 @@
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from fastapi import FastAPI, HTTPException
+import re
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime
+from queue import Queue
+import asyncpg
+from cachetools import LRUCache, TTLCache
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from supabase import create_client
-from langdetect import detect, LangDetectException
+from fastapi.responses import ORJSONResponse
+import msgspec
+import orjson
+from supabase import acreate_client, AsyncClient
+from supabase.lib.client_options import AsyncClientOptions
+from langdetect import DetectorFactory, PROFILES_DIRECTORY
+from langdetect.lang_detect_exception import LangDetectException
+from langdetect.utils.lang_profile import LangProfile
+try:
+    import pycld2
+except ImportError:
+    pycld2 = None
 from dotenv import load_dotenv
+import httpx
 import uvicorn
 
 # -------------------------------------------------------------------
@@ -13,75 +34,482 @@ import uvicorn
 load_dotenv()
 
 # -------------------------------------------------------------------
-# 2️⃣ Initialize FastAPI
+# 2️⃣ Configure logging
 # -------------------------------------------------------------------
-app = FastAPI(title="Axial Data API", version="1.0.0")
+# Handlers run on a QueueListener thread, so the request path only
+# enqueues a record instead of blocking on a stdout write.
+_log_queue: Queue = Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+logger = logging.getLogger("axial")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+
+# -------------------------------------------------------------------
+# 3️⃣ Initialize FastAPI
+# -------------------------------------------------------------------
+# orjson serializes the dict-heavy Supabase result lists several times
+# faster than stdlib json, and handles datetimes natively.
+app = FastAPI(title="Axial Data API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # -------------------------------------------------------------------
-# 3️⃣ Enable CORS for frontend
+# 4️⃣ Enable CORS for frontend
 # -------------------------------------------------------------------
+# Static allowlist: wildcard + credentials forces Starlette to validate
+# and echo the Origin per response (and browsers reject the combo
+# anyway); explicit origins/headers take the cheap fast path and let
+# browsers cache the preflight for a day.
+CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",") if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 # -------------------------------------------------------------------
-# 4️⃣ Load Supabase environment variables
+# 5️⃣ Load Supabase environment variables
 # -------------------------------------------------------------------
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
-print("🔍 Environment check:")
-print(f"SUPABASE_URL: {'✅' if SUPABASE_URL else '❌'}")
-print(f"SUPABASE_ANON_KEY: {'✅' if SUPABASE_ANON_KEY else '❌'} ({len(SUPABASE_ANON_KEY or '')} chars)")
-print(f"SUPABASE_SERVICE_ROLE_KEY: {'✅' if SUPABASE_SERVICE_ROLE_KEY else '❌'} ({len(SUPABASE_SERVICE_ROLE_KEY or '')} chars)")
+logger.info("🔍 Environment check:")
+logger.info("SUPABASE_URL: %s", "✅" if SUPABASE_URL else "❌")
+logger.info("SUPABASE_ANON_KEY: %s (%d chars)", "✅" if SUPABASE_ANON_KEY else "❌", len(SUPABASE_ANON_KEY or ""))
+logger.info("SUPABASE_SERVICE_ROLE_KEY: %s (%d chars)", "✅" if SUPABASE_SERVICE_ROLE_KEY else "❌", len(SUPABASE_SERVICE_ROLE_KEY or ""))
 
 # -------------------------------------------------------------------
-# 5️⃣ Initialize Supabase clients
+# 6️⃣ Initialize Supabase clients
 # -------------------------------------------------------------------
-supabase_client = None
-service_client = None
+supabase_client: AsyncClient | None = None
+service_client: AsyncClient | None = None
+
+# Pooled httpx clients handed to the Supabase clients, kept so shutdown
+# can close them.
+_httpx_clients: list = []
 
-def create_supabase_clients():
-    """Initialize Supabase anon + service clients safely."""
+def _client_options() -> AsyncClientOptions:
+    """Options with a pooled httpx client so TCP+TLS sessions are reused."""
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    _httpx_clients.append(client)
+    return AsyncClientOptions(httpx_client=client)
+
+async def create_supabase_clients():
+    """Initialize Supabase anon + service async clients safely.
+
+    Idempotent: a second call (e.g. after a dev reload re-imports the
+    module) reuses the existing clients instead of opening new TLS
+    sessions.
+    """
     global supabase_client, service_client
 
+    if service_client is not None:
+        return
+
     if not (SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY):
-        print("❌ Missing required environment variables!")
+        logger.error("❌ Missing required environment variables!")
         return
 
     try:
         # Service client (writes / admin)
-        service_client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
-        test = service_client.table("data_items").select("id").limit(1).execute()
-        print("✅ Service client connected!" if test.data is not None else "⚠️ Connected, but table empty or restricted.")
+        service_client = await acreate_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, options=_client_options())
+        if os.getenv("SUPABASE_HEALTHCHECK"):
+            test = await service_client.table("data_items").select("id").limit(1).execute()
+            logger.info("✅ Service client connected!" if test.data is not None else "⚠️ Connected, but table empty or restricted.")
 
         # Anon client (reads / public)
         if SUPABASE_ANON_KEY:
-            supabase_client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
-            print("✅ Anon client connected")
+            supabase_client = await acreate_client(SUPABASE_URL, SUPABASE_ANON_KEY, options=_client_options())
+            logger.info("✅ Anon client connected")
         else:
-            print("⚠️ Missing anon key — only service client active.")
+            logger.warning("⚠️ Missing anon key — only service client active.")
     except Exception as e:
-        print(f"❌ Supabase connection failed: {e}")
+        logger.error("❌ Supabase connection failed: %s", e)
         supabase_client = None
         service_client = None
 
-create_supabase_clients()
+# Direct pooled Postgres (Supabase's pgBouncer pooler, port 6543) for
+# the hot endpoints — the REST→PostgREST hop costs ~400-500 ms per call
+# vs sub-millisecond for the actual DB work. The REST clients stay
+# around as a fallback and for anything that needs RLS enforcement.
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+
+# asyncpg prepares and caches statements per connection, so the
+# recurring /data SELECT is parsed and planned once instead of on every
+# call (~1 ms saved per query plus Postgres backend CPU). That is only
+# safe when each pooled connection maps to one server backend: set
+# SUPABASE_DB_POOL_MODE=session when pointing at port 5432 or a
+# session-mode pooler; the default assumes pgBouncer transaction mode
+# (port 6543), where the cache must stay off.
+SUPABASE_DB_POOL_MODE = os.getenv("SUPABASE_DB_POOL_MODE", "transaction")
+
+_pg_pool: asyncpg.Pool | None = None
+
+async def create_pg_pool():
+    """Create the shared asyncpg pool (idempotent, optional)."""
+    global _pg_pool
+
+    if _pg_pool is not None or not SUPABASE_DB_URL:
+        if not SUPABASE_DB_URL:
+            logger.warning("⚠️ SUPABASE_DB_URL not set — using the REST client for DB access.")
+        return
+
+    try:
+        _pg_pool = await asyncpg.create_pool(
+            dsn=SUPABASE_DB_URL,
+            min_size=2,
+            max_size=10,
+            max_inactive_connection_lifetime=1800,
+            statement_cache_size=256 if SUPABASE_DB_POOL_MODE == "session" else 0,
+        )
+        logger.info("✅ Postgres pool ready")
+    except Exception as e:
+        logger.error("❌ Postgres pool creation failed: %s", e)
+        _pg_pool = None
+
+@app.on_event("startup")
+async def startup_supabase():
+    """Connect to the database and start the ingest flusher on app startup."""
+    global _flusher_task
+    await create_pg_pool()
+    await create_supabase_clients()
+    if (service_client or _pg_pool) and _flusher_task is None:
+        _flusher_task = asyncio.create_task(_flush_batches())
+
+@app.on_event("shutdown")
+async def shutdown_cleanup():
+    """Stop the flusher, fail queued ingests, and close pooled resources."""
+    global _flusher_task, _pg_pool, supabase_client, service_client
+
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        try:
+            await _flusher_task
+        except asyncio.CancelledError:
+            pass
+        _flusher_task = None
+
+    # Anything still queued will never be inserted — unblock its waiter.
+    while not _ingest_queue.empty():
+        _, fut = _ingest_queue.get_nowait()
+        if not fut.done():
+            fut.set_exception(RuntimeError("Server shutting down"))
+
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
+
+    for client in _httpx_clients:
+        await client.aclose()
+    _httpx_clients.clear()
+    supabase_client = None
+    service_client = None
+
+    _log_listener.stop()
+
+# -------------------------------------------------------------------
+# 7️⃣ Language detection
+# -------------------------------------------------------------------
+# Load the langdetect profiles once at import time; langdetect.detect()
+# would otherwise rebuild the factory (all 55 JSON profiles) per call.
+#
+# Only a subset of profiles is loaded — the full set keeps ~44 MB of
+# n-gram tables resident per worker. Content in an excluded language
+# gets classified as the nearest loaded one (or "unknown"), which we
+# accept for this metadata-only field.
+LANGDETECT_LANGUAGES = {
+    "en", "es", "ar", "fr", "de", "it", "pt", "ru",
+    "ja", "ko", "zh-cn", "zh-tw", "hi", "bn", "id",
+}
+
+def _load_profiles(factory: DetectorFactory, languages: set):
+    """Load only `languages` from PROFILES_DIRECTORY into `factory`."""
+    filenames = [f for f in sorted(os.listdir(PROFILES_DIRECTORY)) if f in languages]
+    for index, filename in enumerate(filenames):
+        with open(os.path.join(PROFILES_DIRECTORY, filename), encoding="utf-8") as f:
+            profile = LangProfile(**json.load(f))
+        factory.add_profile(profile, index, len(filenames))
+
+_detector_factory = DetectorFactory()
+_load_profiles(_detector_factory, LANGDETECT_LANGUAGES)
+_detector_factory.seed = 0
+
+# pycld2 (C++ CLD2) detects in well under a millisecond vs tens of ms
+# for langdetect; langdetect stays available behind USE_LANGDETECT or
+# when pycld2 is not installed.
+USE_LANGDETECT = bool(os.getenv("USE_LANGDETECT")) or pycld2 is None
+
+# CLD2 returns "Unknown" for URL/symbol-heavy strings, so strip those
+# out and reassemble the words before detecting.
+_DETECT_CLEAN_RE = re.compile(r"https?://\S+|[^\w\s']", re.UNICODE)
+
+def _clean_for_detect(text: str) -> str:
+    return " ".join(_DETECT_CLEAN_RE.sub(" ", text).split())
+
+def _detect_raw(text: str) -> str:
+    """Detect the language of `text` via pycld2, or langdetect as fallback."""
+    cleaned = _clean_for_detect(text) or text
+    if not USE_LANGDETECT:
+        is_reliable, _, details = pycld2.detect(cleaned)
+        code = details[0][1]
+        return code if is_reliable and code != "un" else "unknown"
+    detector = _detector_factory.create()
+    detector.append(cleaned)
+    return detector.detect()
+
+# Ingested content repeats (reposts, retries), so remember results by a
+# short content hash instead of re-detecting identical payloads. Length
+# is part of the key so truncation variants cannot collide. _detect runs
+# on executor threads and LRUCache is not thread-safe (even .get()
+# reorders entries), so all cache access goes through a lock.
+_lang_cache = LRUCache(maxsize=4096)
+_lang_cache_lock = threading.Lock()
+
+# Short pure-ASCII strings are both overwhelmingly English in our feed
+# and too short for the detectors to classify reliably — skip detection.
+_ASCII_RE = re.compile(r"^[\x00-\x7F]+$")
+_ASCII_FAST_PATH_MAX = 20
+
+def _detect(text: str) -> str:
+    """Detect the language of `text`, reusing cached results for repeats."""
+    if len(text) < _ASCII_FAST_PATH_MAX and _ASCII_RE.match(text):
+        return "en"
+    key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), len(text))
+    with _lang_cache_lock:
+        lang = _lang_cache.get(key)
+    if lang is None:
+        lang = _detect_raw(text)
+        with _lang_cache_lock:
+            _lang_cache[key] = lang
+    return lang
+
+# -------------------------------------------------------------------
+# 8️⃣ In-process cache for /data
+# -------------------------------------------------------------------
+# Both tiers hold serialized response bodies, keyed by (limit, fields, before).
+_data_cache = TTLCache(maxsize=128, ttl=15)   # fresh entries
+_stale_cache = TTLCache(maxsize=128, ttl=60)  # stale-while-revalidate copies
+_cache_lock = asyncio.Lock()
+
+# Bumped on every invalidation; a fetch whose read started under an
+# older generation must not write its (pre-insert) result back into the
+# cache after the clear.
+_cache_generation = 0
+
+# In-flight background refreshes by key: coalesces the stale path to one
+# upstream query per key and keeps a strong reference so the task is not
+# garbage-collected mid-flight.
+_refresh_tasks: dict = {}
+
+def _spawn_refresh(key: tuple, limit: int, fields: str, before: str | None):
+    """Start a background refresh for `key` unless one is already running."""
+    if key in _refresh_tasks:
+        return
+    task = asyncio.create_task(_refresh_recent(limit, fields, before))
+    _refresh_tasks[key] = task
+    task.add_done_callback(lambda _, key=key: _refresh_tasks.pop(key, None))
+
+# Default column projection for /data — narrower rows mean less
+# serialization and fewer bytes on the wire. Callers that need more
+# pass ?fields=... (comma-separated column names, "*" allowed).
+_DEFAULT_FIELDS = "id,source,language_code,created_at"
+_ALLOWED_COLUMNS = ("id", "source", "content", "language_code", "labels", "created_at")
+
+def _select_columns(fields: str) -> str:
+    """Validate a `fields` string against the column whitelist for SQL use."""
+    if fields.strip() == "*":
+        return "*"
+    columns = [c.strip() for c in fields.split(",") if c.strip()]
+    unknown = [c for c in columns if c not in _ALLOWED_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return ", ".join(columns)
+
+async def _fetch_recent_pg(limit: int, fields: str, before: str | None) -> bytes:
+    """Recent rows straight from Postgres as a ready-to-send JSON body.
+
+    Postgres builds the row array server-side with json_agg, so Python
+    only splices the raw bytes into the response envelope — no
+    per-request parse and re-encode of the result set.
+    """
+    cols = _select_columns(fields)
+    has_cursor = cols == "*" or "created_at" in cols
+    args = []
+    where = ""
+    if before:
+        where = " WHERE created_at < $1"
+        args.append(datetime.fromisoformat(before.replace("Z", "+00:00")))
+    inner = f"SELECT {cols} FROM data_items{where} ORDER BY created_at DESC LIMIT ${len(args) + 1}"
+    args.append(limit)
+    agg = "json_agg(t ORDER BY t.created_at DESC)" if has_cursor else "json_agg(t)"
+    cursor = "min(t.created_at)" if has_cursor else "NULL::timestamptz"
+    sql = f"SELECT coalesce({agg}, '[]')::text, count(*), {cursor} FROM ({inner}) t"
+    async with _pg_pool.acquire() as conn:
+        data_text, count, next_cursor = await conn.fetchrow(sql, *args)
+    return (
+        b'{"status":"success","data":' + data_text.encode()
+        + b',"count":' + str(count).encode()
+        + b',"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+    )
+
+async def _fetch_recent_rest(limit: int, fields: str, before: str | None) -> list:
+    """Recent rows via the Supabase REST client (fallback path)."""
+    client = supabase_client or service_client
+    query = client.table("data_items").select(fields).order("created_at", desc=True).limit(limit)
+    if before:
+        query = query.lt("created_at", before)
+    response = await query.execute()
+    return response.data or []
+
+async def _fetch_recent(limit: int, fields: str, before: str | None = None) -> bytes:
+    """Query the database for recent rows and refresh both cache tiers.
+
+    Returns (and caches) the serialized response body, so cache hits
+    skip JSON encoding entirely. Pagination is keyset-based: `before`
+    is a created_at cursor, so each page is a constant-cost index scan
+    regardless of how deep the caller has paged (needs the btree index:
+    CREATE INDEX ON data_items (created_at)).
+    """
+    generation = _cache_generation
+    if _pg_pool is not None:
+        body = await _fetch_recent_pg(limit, fields, before)
+    else:
+        data = await _fetch_recent_rest(limit, fields, before)
+        body = orjson.dumps({
+            "status": "success",
+            "data": data,
+            "count": len(data),
+            "next_cursor": data[-1].get("created_at") if data else None,
+        })
+    if generation == _cache_generation:
+        key = (limit, fields, before)
+        _data_cache[key] = body
+        _stale_cache[key] = body
+    return body
+
+async def _refresh_recent(limit: int, fields: str, before: str | None = None):
+    """Background cache refresh — failures just leave the stale copy in place."""
+    try:
+        await _fetch_recent(limit, fields, before)
+    except Exception as e:
+        logger.warning("⚠️ Background /data refresh failed: %s", e)
 
 # -------------------------------------------------------------------
-# 6️⃣ Define request model
+# Micro-batcher for /ingest
 # -------------------------------------------------------------------
-class IngestRequest(BaseModel):
+# Each single-row insert pays a full HTTPS roundtrip to Supabase.
+# Queue items instead and flush them in one insert([...]) call every
+# 50 ms (or once the batch is full), so burst traffic shares roundtrips.
+_FLUSH_INTERVAL = 0.05
+_MAX_BATCH = 100
+_ingest_queue: asyncio.Queue = asyncio.Queue()
+_flusher_task: asyncio.Task | None = None
+
+_INSERT_SQL = """
+    INSERT INTO data_items (source, content, language_code, labels)
+    VALUES ($1, $2, $3, $4)
+    RETURNING *
+"""
+
+async def _insert_batch_pg(items: list) -> list:
+    """Insert a batch over one pooled connection in one transaction."""
+    rows = []
+    async with _pg_pool.acquire() as conn:
+        async with conn.transaction():
+            for item in items:
+                row = await conn.fetchrow(
+                    _INSERT_SQL,
+                    item["source"],
+                    item["content"],
+                    item["language_code"],
+                    list(item["labels"]),
+                )
+                rows.append(dict(row))
+    return rows
+
+async def _flush_batches():
+    """Drain the ingest queue, writing each batch as a single insert."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _ingest_queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_ingest_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            if _pg_pool is not None:
+                rows = await _insert_batch_pg([item for item, _ in batch])
+            else:
+                response = await service_client.table("data_items").insert([item for item, _ in batch]).execute()
+                rows = response.data or []
+            for (_, fut), row in zip(batch, rows):
+                if not fut.done():
+                    fut.set_result(row)
+            for _, fut in batch[len(rows):]:
+                if not fut.done():
+                    fut.set_exception(RuntimeError("Insert failed — no data returned"))
+        except asyncio.CancelledError:
+            # Shutdown caught us mid-batch — fail the waiters instead of
+            # leaving their futures pending forever.
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(RuntimeError("Server shutting down"))
+            raise
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
+async def _insert_item(item: dict) -> dict:
+    """Enqueue `item` for the next batch flush and await its inserted row."""
+    fut = asyncio.get_running_loop().create_future()
+    await _ingest_queue.put((item, fut))
+    return await fut
+
+async def _invalidate_data_cache():
+    """Drop all cached /data entries so the next read sees fresh rows.
+
+    Results are ordered by created_at desc, so a new row affects every
+    cached key — a full clear is the cheapest correct option. The
+    generation bump makes any in-flight fetch that read before this
+    point drop its cache write instead of repopulating stale bytes.
+    """
+    global _cache_generation
+    async with _cache_lock:
+        _cache_generation += 1
+        _data_cache.clear()
+        _stale_cache.clear()
+
+# -------------------------------------------------------------------
+# 9️⃣ Define request model
+# -------------------------------------------------------------------
+class IngestRequest(msgspec.Struct):
     source: str
     content: str
 
+# One reusable decoder — msgspec skips pydantic's per-field validator
+# dispatch and decodes JSON straight into the struct.
+_ingest_decoder = msgspec.json.Decoder(IngestRequest)
+
+# Immutable per-request constants, hoisted so handlers do not
+# reallocate them on every call. Placeholder auto-labels for now.
+_DEFAULT_LABELS = ("africa", "tech", "pending")
+_DOCS_RESPONSE = {"docs": "/docs", "redoc": "/redoc"}
+
 # -------------------------------------------------------------------
-# 7️⃣ Routes
+# 🔟 Routes
 # -------------------------------------------------------------------
 @app.get("/")
 async def root():
@@ -93,67 +521,137 @@ async def root():
     }
 
 @app.post("/ingest")
-async def ingest_data(payload: IngestRequest):
-    """Insert a new content item into Supabase."""
-    if not service_client:
-        raise HTTPException(status_code=500, detail="Supabase service client not available")
+async def ingest_data(request: Request):
+    """Insert a new content item into the database."""
+    if not (service_client or _pg_pool):
+        raise HTTPException(status_code=500, detail="No database client available")
+
+    try:
+        payload = _ingest_decoder.decode(await request.body())
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
 
     try:
         try:
-            lang = detect(payload.content)
+            # Detection is CPU-bound — run it on the default thread
+            # executor so the event loop keeps servicing other requests
+            # (and the batch flusher) while it runs.
+            lang = await asyncio.get_running_loop().run_in_executor(None, _detect, payload.content)
         except LangDetectException:
             lang = "unknown"
 
-        # Placeholder auto-labels
-        labels = ["africa", "tech", "pending"]
-
         item = {
             "source": payload.source,
             "content": payload.content,
             "language_code": lang,
-            "labels": labels
+            "labels": _DEFAULT_LABELS
         }
 
-        response = service_client.table("data_items").insert(item).execute()
-        if response.data:
-            inserted_item = response.data[0]
-            print(f"✅ Inserted record ID: {inserted_item.get('id', 'unknown')}")
-            return {"status": "success", "item": inserted_item}
-        else:
-            raise HTTPException(status_code=500, detail="Insert failed — no data returned")
+        inserted_item = await _insert_item(item)
+        await _invalidate_data_cache()
+        logger.info("✅ Inserted record ID: %s", inserted_item.get("id", "unknown"))
+        return {"status": "success", "item": inserted_item}
 
     except Exception as e:
-        print(f"❌ Ingest error: {str(e)}")
+        logger.error("❌ Ingest error: %s", e)
         raise HTTPException(status_code=500, detail=f"Ingest failed: {str(e)}")
 
+async def _recent_body(limit: int, fields: str, before: str | None) -> bytes:
+    """Resolve the serialized /data body through the cache tiers."""
+    key = (limit, fields, before)
+    cached = _data_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stale = _stale_cache.get(key)
+    if stale is not None:
+        # Serve the stale copy immediately and refresh in the background.
+        _spawn_refresh(key, limit, fields, before)
+        return stale
+
+    async with _cache_lock:
+        # Re-check: a concurrent miss may have populated the cache while we waited.
+        cached = _data_cache.get(key)
+        if cached is not None:
+            return cached
+        return await _fetch_recent(limit, fields, before)
+
 @app.get("/data")
-async def get_recent_data(limit: int = 10):
-    """Fetch recent records from Supabase."""
-    client = supabase_client or service_client
-    if not client:
+async def get_recent_data(request: Request, limit: int = Query(10, ge=1, le=100), fields: str = _DEFAULT_FIELDS, before: str | None = None):
+    """Fetch recent records from Supabase, projecting only `fields`.
+
+    Pass the returned `next_cursor` back as `before` to page further —
+    keyset pagination keeps page latency flat as the table grows.
+    Responses carry Cache-Control and a weak ETag so CDNs and browsers
+    can serve repeats without touching the backend.
+    """
+    if not (supabase_client or service_client or _pg_pool):
         raise HTTPException(status_code=500, detail="No database client available")
 
+    # Bad query parameters are client errors — reject them up front with
+    # a 400 on both backends instead of surfacing as a 500 downstream.
+    _select_columns(fields)
+    if before is not None:
+        try:
+            datetime.fromisoformat(before.replace("Z", "+00:00"))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid 'before' cursor — expected an ISO 8601 timestamp")
+
     try:
-        response = client.table("data_items").select("*").order("created_at", desc=True).limit(limit).execute()
-        return {"status": "success", "data": response.data or [], "count": len(response.data or [])}
+        body = await _recent_body(limit, fields, before)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
+    etag = 'W/"' + hashlib.blake2s(body, digest_size=8).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=15, stale-while-revalidate=60"}
+    if request.headers.get("if-none-match") == etag:
+        # RFC 9110 §15.4.5: the 304 must repeat the validator (and
+        # should repeat Cache-Control) so caches can refresh their copy.
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/data/count")
+async def get_data_count():
+    """Total row count without transferring any row payload."""
+    client = supabase_client or service_client
+    if not (client or _pg_pool):
+        raise HTTPException(status_code=500, detail="No database client available")
+
+    try:
+        if _pg_pool is not None:
+            count = await _pg_pool.fetchval("SELECT count(*) FROM data_items")
+        else:
+            response = await client.table("data_items").select("id", count="exact", head=True).execute()
+            count = response.count
+        return {"status": "success", "count": count or 0}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Count failed: {str(e)}")
+
 @app.get("/docs")
 async def docs_link():
     """Simple documentation endpoint."""
-    return {
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return _DOCS_RESPONSE
 
 # -------------------------------------------------------------------
-# 8️⃣ Launch the app (for Railway or local)
+# 1️⃣1️⃣ Launch the app (for Railway or local)
 # -------------------------------------------------------------------
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    if not service_client:
-        print("❌ Cannot start — Supabase not connected. Check .env or Railway Variables.")
-    else:
-        print("🚀 Starting Axial Data API on port", port)
-        uvicorn.run("app:app", host="0.0.0.0", port=port)
\ No newline at end of file
+    dev = os.getenv("ENV") == "dev"
+    # uvicorn[standard] ships uvloop + httptools; 2n+1 workers is the
+    # usual sizing, overridable via WEB_CONCURRENCY.
+    workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+    logger.info("🚀 Starting Axial Data API on port %d", port)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if dev else workers,
+        reload=dev,
+    )
\ No newline at end of file